@@ -29,6 +29,17 @@ class KubeflowEntrypointConfiguration(StepEntrypointConfiguration):
     This class writes a markdown file that will be displayed in the KFP UI.
     """
 
+    def __init__(self, arguments: List[str]):
+        """Initializes the entrypoint configuration.
+
+        Args:
+            arguments: Command line arguments to configure this object.
+        """
+        super().__init__(arguments)
+        self._metadata_ui_path: str = self.entrypoint_args[
+            METADATA_UI_PATH_OPTION
+        ]
+
     @classmethod
     def get_entrypoint_options(cls) -> Set[str]:
         """Gets all options required for running with this configuration.
@@ -79,5 +90,5 @@ class KubeflowEntrypointConfiguration(StepEntrypointConfiguration):
         if execution_info:
             utils.dump_ui_metadata(
                 execution_info=execution_info,
-                metadata_ui_path=self.entrypoint_args[METADATA_UI_PATH_OPTION],
+                metadata_ui_path=self._metadata_ui_path,
             )
@@ -34,6 +34,9 @@ logger = get_logger(__name__)
 if TYPE_CHECKING:
     from passlib.context import CryptContext  # type: ignore[import]
 
+# Matches bcrypt hashes, which are stored instead of the plain secrets.
+_HASHED_SECRET_REGEX = re.compile(r"^\$2[ayb]\$.{56}$")
+
 
 class JWTTokenType(StrEnum):
     """The type of JWT token."""
@@ -227,10 +230,7 @@ class UserModel(DomainModel, AnalyticsTrackedModelMixin):
         Returns:
             True if the secret value is hashed, otherwise False.
         """
-        return (
-            re.match(r"^\$2[ayb]\$.{56}$", secret.get_secret_value())
-            is not None
-        )
+        return _HASHED_SECRET_REGEX.match(secret.get_secret_value()) is not None
 
     @classmethod
     def _get_hashed_secret(cls, secret: Optional[SecretStr]) -> Optional[str]:
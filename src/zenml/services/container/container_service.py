@@ -17,14 +17,16 @@ import os
 import pathlib
 import sys
 import tempfile
+import threading
 import time
 from abc import abstractmethod
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, Generator, List, Optional, Tuple
 
 import docker.errors as docker_errors
 from docker.client import DockerClient
 from docker.models.containers import Container
 from pydantic import Field
+from requests.exceptions import RequestException
 
 from zenml.constants import ENV_ZENML_CONFIG_PATH
 from zenml.logger import get_logger
@@ -167,18 +169,49 @@ class ContainerService(BaseService):
     # TODO [ENG-705]: allow multiple endpoints per service
     endpoint: Optional[ContainerServiceEndpoint] = None
 
-    _docker_client: Optional[DockerClient] = None
+    # The docker client is shared by all container services of the process.
+    _docker_client: ClassVar[Optional[DockerClient]] = None
+    _docker_client_pid: ClassVar[Optional[int]] = None
+    _docker_client_lock: ClassVar[threading.Lock] = threading.Lock()
 
     @property
     def docker_client(self) -> DockerClient:
         """Initialize and/or return the docker client.
 
+        The client is shared by all container services of the process and
+        created again in forked processes.
+
         Returns:
             The docker client.
         """
-        if self._docker_client is None:
-            self._docker_client = DockerClient.from_env()
-        return self._docker_client
+        docker_client = ContainerService._docker_client
+        if (
+            docker_client is None
+            or ContainerService._docker_client_pid != os.getpid()
+        ):
+            with ContainerService._docker_client_lock:
+                docker_client = ContainerService._docker_client
+                if (
+                    docker_client is None
+                    or ContainerService._docker_client_pid != os.getpid()
+                ):
+                    docker_client = DockerClient.from_env()
+                    ContainerService._docker_client = docker_client
+                    ContainerService._docker_client_pid = os.getpid()
+        return docker_client
+
+    @classmethod
+    def _discard_docker_client(cls, docker_client: DockerClient) -> None:
+        """Discard the shared docker client after it failed to reach the daemon.
+
+        The next access of the `docker_client` property creates a new client.
+
+        Args:
+            docker_client: The client that failed.
+        """
+        with ContainerService._docker_client_lock:
+            if ContainerService._docker_client is docker_client:
+                ContainerService._docker_client = None
 
     @property
     def container_id(self) -> str:
@@ -212,13 +245,21 @@ class ContainerService(BaseService):
             The operational state of the docker container and a message
             providing additional information about that state (e.g. a
             description of the error, if one is encountered).
+
+        Raises:
+            RequestException: if the docker daemon could not be reached.
         """
         container: Optional[Container] = None
+        docker_client = self.docker_client
         try:
-            container = self.docker_client.containers.get(self.container_id)
+            container = docker_client.containers.get(self.container_id)
         except docker_errors.NotFound:
             # container doesn't exist yet or was removed
             pass
+        except RequestException:
+            # the daemon could not be reached, e.g. because it was restarted
+            self._discard_docker_client(docker_client)
+            raise
 
         if container is None:
             return ServiceState.INACTIVE, "Docker container is not present"
@@ -350,12 +391,20 @@ class ContainerService(BaseService):
         Returns:
             The docker container for the service, or None if the container
             does not exist.
+
+        Raises:
+            RequestException: if the docker daemon could not be reached.
         """
+        docker_client = self.docker_client
         try:
-            return self.docker_client.containers.get(self.container_id)
+            return docker_client.containers.get(self.container_id)
         except docker_errors.NotFound:
             # container doesn't exist yet or was removed
             return None
+        except RequestException:
+            # the daemon could not be reached, e.g. because it was restarted
+            self._discard_docker_client(docker_client)
+            raise
 
     def _start_container(self) -> None:
         """Start the service docker container associated with this service."""
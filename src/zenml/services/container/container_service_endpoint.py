@@ -29,7 +29,7 @@ from zenml.services.service_monitor import (
     HTTPEndpointHealthMonitor,
     TCPEndpointHealthMonitor,
 )
-from zenml.utils.networking_utils import port_available, scan_for_available_port
+from zenml.utils.networking_utils import find_available_port, port_available
 
 logger = get_logger(__name__)
 
@@ -91,6 +91,9 @@ class ContainerServiceEndpoint(BaseServiceEndpoint):
         As a last resort, this call will search for a free TCP port, if
         `allocate_port` is set to True in the endpoint configuration.
 
+        Ports are checked on all interfaces of the host, as the container
+        publishes its port on all of them.
+
         Returns:
             An available TCP port number
 
@@ -101,19 +104,17 @@ class ContainerServiceEndpoint(BaseServiceEndpoint):
         """
         # If a port value is explicitly configured, attempt to use it first
         if self.config.port:
-            if port_available(self.config.port):
+            if port_available(self.config.port, "0.0.0.0"):
                 return self.config.port
             if not self.config.allocate_port:
                 raise IOError(f"TCP port {self.config.port} is not available.")
 
         # Attempt to reuse the port used when the services was last running
-        if self.status.port and port_available(self.status.port):
+        if self.status.port and port_available(self.status.port, "0.0.0.0"):
             return self.status.port
 
-        port = scan_for_available_port()
-        if port:
-            return port
-        raise IOError("No free TCP ports found")
+        # Let the OS pick a free port instead of probing a range port by port
+        return find_available_port("0.0.0.0")
 
     def prepare_for_start(self) -> None:
         """Prepare the service endpoint for starting.
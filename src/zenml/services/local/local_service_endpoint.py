@@ -29,7 +29,7 @@ from zenml.services.service_monitor import (
     HTTPEndpointHealthMonitor,
     TCPEndpointHealthMonitor,
 )
-from zenml.utils.networking_utils import port_available, scan_for_available_port
+from zenml.utils.networking_utils import find_available_port, port_available
 
 logger = get_logger(__name__)
 
@@ -110,13 +110,13 @@ class LocalDaemonServiceEndpoint(BaseServiceEndpoint):
                 raise IOError(f"TCP port {self.config.port} is not available.")
 
         # Attempt to reuse the port used when the services was last running
-        if self.status.port and port_available(self.status.port):
+        if self.status.port and port_available(
+            self.status.port, self.config.ip_address
+        ):
             return self.status.port
 
-        port = scan_for_available_port()
-        if port:
-            return port
-        raise IOError("No free TCP ports found")
+        # Let the OS pick a free port instead of probing a range port by port
+        return find_available_port(self.config.ip_address)
 
     def prepare_for_start(self) -> None:
         """Prepare the service endpoint for starting.
@@ -278,11 +278,24 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
         """
         time_remaining = timeout
         while True:
-            if self.admin_state == ServiceState.ACTIVE and self.is_running:
+            # Query the external service (and its endpoint) only once per
+            # iteration instead of once for every state that is checked.
+            self.update_status()
+            state = self.status.state
+            if self.admin_state == ServiceState.ACTIVE and (
+                state == ServiceState.ACTIVE
+                and (
+                    not self.endpoint
+                    or self.endpoint.status.state == ServiceState.ACTIVE
+                )
+            ):
                 return True
-            if self.admin_state == ServiceState.INACTIVE and self.is_stopped:
+            if (
+                self.admin_state == ServiceState.INACTIVE
+                and state == ServiceState.INACTIVE
+            ):
                 return True
-            if self.is_failed:
+            if state == ServiceState.ERROR:
                 return False
             if time_remaining <= 0:
                 break
@@ -55,14 +55,21 @@ def port_available(port: int, address: str = "127.0.0.1") -> bool:
     return True
 
 
-def find_available_port() -> int:
+def find_available_port(address: str = "127.0.0.1") -> int:
     """Finds a local random unoccupied TCP port.
 
+    The port is only reserved while it is looked up, so another process can
+    still take it before the caller binds it.
+
+    Args:
+        address: IP address on the local machine on which the port must be
+            available.
+
     Returns:
         A random unoccupied TCP port.
     """
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("127.0.0.1", 0))
+        s.bind((address, 0))
         _, port = s.getsockname()
 
     return cast(int, port)
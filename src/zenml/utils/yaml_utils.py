@@ -23,6 +23,13 @@ import yaml
 from zenml.io import fileio
 from zenml.utils import io_utils
 
+try:
+    # The libyaml based loader is considerably faster, but only available if
+    # PyYAML was built with libyaml.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[misc]
+
 
 def write_yaml(
     file_path: str,
@@ -82,10 +89,12 @@ def read_yaml(file_path: str) -> Any:
         FileNotFoundError: if file does not exist.
     """
     if fileio.exists(file_path):
-        contents = io_utils.read_file_contents_as_string(file_path)
-        # TODO: [LOW] consider adding a default empty dict to be returned
-        #   instead of None
-        return yaml.safe_load(contents)
+        # Let the loader read the file in chunks instead of reading all of it
+        # into a string first.
+        with fileio.open(file_path) as f:
+            # TODO: [LOW] consider adding a default empty dict to be returned
+            #   instead of None
+            return yaml.load(f, Loader=SafeLoader)
     else:
         raise FileNotFoundError(f"{file_path} does not exist.")
 
@@ -101,8 +101,11 @@ def token(
     role_assignments = zen_store().list_role_assignments(
         user_name_or_id=auth_context.user.id, project_name_or_id=None
     )
+    # Users are often assigned the same role in multiple projects, so only
+    # fetch each distinct role once.
+    role_ids = {ra.role for ra in role_assignments}
     permissions = set().union(
-        *[zen_store().get_role(ra.role).permissions for ra in role_assignments]
+        *[zen_store().get_role(role_id).permissions for role_id in role_ids]
     )
 
     access_token = auth_context.user.generate_access_token(
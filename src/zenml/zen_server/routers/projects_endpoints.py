@@ -233,17 +233,14 @@ def list_project_stacks(
     Returns:
         All stacks part of the specified project.
     """
-    stacks_list = zen_store().list_stacks(
+    return zen_store().list_stacks(
         project_name_or_id=project_name_or_id,
         user_name_or_id=user_name_or_id,
         component_id=component_id,
         is_shared=is_shared,
         name=stack_name,
+        hydrated=hydrated,
     )
-    if hydrated:
-        return [stack.to_hydrated_model() for stack in stacks_list]
-    else:
-        return stacks_list
 
 
 @router.post(
@@ -318,18 +315,15 @@ def list_project_stack_components(
     Returns:
         All stack components part of the specified project.
     """
-    components_list = zen_store().list_stack_components(
+    return zen_store().list_stack_components(
         project_name_or_id=project_name_or_id,
         user_name_or_id=user_name_or_id,
         type=type,
         is_shared=is_shared,
         name=name,
         flavor_name=flavor_name,
+        hydrated=hydrated,
     )
-    if hydrated:
-        return [comp.to_hydrated_model() for comp in components_list]
-    else:
-        return components_list
 
 
 @router.post(
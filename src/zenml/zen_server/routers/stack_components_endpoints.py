@@ -69,18 +69,15 @@ def list_stack_components(
     Returns:
         List of stack components for a specific type.
     """
-    components_list = zen_store().list_stack_components(
+    return zen_store().list_stack_components(
         project_name_or_id=project_name_or_id,
         user_name_or_id=user_name_or_id,
         type=type,
         name=name,
         flavor_name=flavor_name,
         is_shared=is_shared,
+        hydrated=hydrated,
     )
-    if hydrated:
-        return [comp.to_hydrated_model() for comp in components_list]
-    else:
-        return components_list
 
 
 @router.get(
@@ -0,0 +1,40 @@
+"""Add stack and component list indexes [1ac1b9c04da1].
+
+Revision ID: 1ac1b9c04da1
+Revises: 613796c1b941
+Create Date: 2022-11-24 11:02:17.204675
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1ac1b9c04da1"
+down_revision = "613796c1b941"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("stack", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_stack_project_id_is_shared",
+            ["project_id", "is_shared"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("stack_component", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_stack_component_project_id_is_shared_type",
+            ["project_id", "is_shared", "type"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("stack_component", schema=None) as batch_op:
+        batch_op.drop_index("ix_stack_component_project_id_is_shared_type")
+
+    with op.batch_alter_table("stack", schema=None) as batch_op:
+        batch_op.drop_index("ix_stack_project_id_is_shared")
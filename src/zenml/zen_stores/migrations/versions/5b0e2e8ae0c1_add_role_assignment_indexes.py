@@ -0,0 +1,52 @@
+"""Add role assignment indexes [5b0e2e8ae0c1].
+
+Revision ID: 5b0e2e8ae0c1
+Revises: 1ac1b9c04da1
+Create Date: 2022-11-25 09:41:06.318427
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b0e2e8ae0c1"
+down_revision = "1ac1b9c04da1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("user_role_assignment", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_user_role_assignment_user_id_role_id_project_id",
+            ["user_id", "role_id", "project_id"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("team_role_assignment", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_team_role_assignment_team_id_role_id_project_id",
+            ["team_id", "role_id", "project_id"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("role_permission", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_role_permission_role_id", ["role_id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("role_permission", schema=None) as batch_op:
+        batch_op.drop_index("ix_role_permission_role_id")
+
+    with op.batch_alter_table("team_role_assignment", schema=None) as batch_op:
+        batch_op.drop_index(
+            "ix_team_role_assignment_team_id_role_id_project_id"
+        )
+
+    with op.batch_alter_table("user_role_assignment", schema=None) as batch_op:
+        batch_op.drop_index(
+            "ix_user_role_assignment_user_id_role_id_project_id"
+        )
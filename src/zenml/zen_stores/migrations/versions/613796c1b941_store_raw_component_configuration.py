@@ -0,0 +1,57 @@
+"""Store raw component configuration [613796c1b941].
+
+Revision ID: 613796c1b941
+Revises: 0.22.0
+Create Date: 2022-11-24 10:12:43.513209
+
+"""
+import base64
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "613796c1b941"
+down_revision = "0.22.0"
+branch_labels = None
+depends_on = None
+
+stack_component = sa.table(
+    "stack_component",
+    sa.column("id", sa.CHAR(32)),
+    sa.column("configuration", sa.LargeBinary()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    # Component configurations used to be stored as base64 encoded JSON.
+    # Decode them so that all rows contain the raw JSON bytes.
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(stack_component.c.id, stack_component.c.configuration)
+    ).fetchall()
+    for id_, configuration in rows:
+        if configuration.startswith(b"{"):
+            continue
+        conn.execute(
+            stack_component.update()
+            .where(stack_component.c.id == id_)
+            .values(configuration=base64.b64decode(configuration))
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(stack_component.c.id, stack_component.c.configuration)
+    ).fetchall()
+    for id_, configuration in rows:
+        if not configuration.startswith(b"{"):
+            continue
+        conn.execute(
+            stack_component.update()
+            .where(stack_component.c.id == id_)
+            .values(configuration=base64.b64encode(configuration))
+        )
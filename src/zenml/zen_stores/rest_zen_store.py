@@ -75,6 +75,7 @@ from zenml.models import (
     ArtifactModel,
     ComponentModel,
     FlavorModel,
+    HydratedComponentModel,
     HydratedStackModel,
     PipelineModel,
     PipelineRunModel,
@@ -599,7 +600,8 @@ class RestZenStore(BaseZenStore):
         flavor_name: Optional[str] = None,
         name: Optional[str] = None,
         is_shared: Optional[bool] = None,
-    ) -> List[ComponentModel]:
+        hydrated: bool = False,
+    ) -> Union[List[ComponentModel], List[HydratedComponentModel]]:
         """List all stack components matching the given filter criteria.
 
         Args:
@@ -611,17 +613,25 @@ class RestZenStore(BaseZenStore):
             name: Optionally filter stack component by name
             is_shared: Optionally filter out stack component by whether they are
                 shared or not
+            hydrated: Flag to decide whether to return hydrated models.
 
         Returns:
             A list of all stack components matching the filter criteria.
         """
         filters = locals()
         filters.pop("self")
-        return self._list_resources(
-            route=STACK_COMPONENTS,
-            resource_model=ComponentModel,
-            **filters,
-        )
+        if hydrated:
+            return self._list_resources(
+                route=STACK_COMPONENTS,
+                resource_model=HydratedComponentModel,
+                **filters,
+            )
+        else:
+            return self._list_resources(
+                route=STACK_COMPONENTS,
+                resource_model=ComponentModel,
+                **filters,
+            )
 
     @track(AnalyticsEvent.UPDATED_STACK_COMPONENT)
     def update_stack_component(
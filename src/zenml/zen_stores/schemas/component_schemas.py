@@ -13,29 +13,84 @@
 #  permissions and limitations under the License.
 """SQL Model Implementations for Stack Components."""
 
-import base64
 import json
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, cast
 from uuid import UUID
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import Column, Index, insert
+from sqlalchemy.orm import selectinload
+from sqlmodel import Field, Relationship, Session, SQLModel, select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from zenml.enums import StackComponentType
-from zenml.models import ComponentModel
+from zenml.models import ComponentModel, HydratedComponentModel
 from zenml.zen_stores.schemas.project_schemas import ProjectSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    InternedString,
+    build_foreign_key_field,
+)
 from zenml.zen_stores.schemas.stack_schemas import (
     StackCompositionSchema,
     StackSchema,
 )
+from zenml.zen_stores.schemas.table_names import STACK_COMPONENT_TABLE
 from zenml.zen_stores.schemas.user_management_schemas import UserSchema
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _encode_configuration(configuration: Dict[str, Any]) -> bytes:
+    """Serialize a component configuration for storage in the database.
+
+    The standard library `json` module is used even if `orjson` is installed:
+    `orjson` silently stores non-finite floats as `null` and serializes
+    values like datetimes or UUIDs that `json` rejects, so the configuration
+    read back would differ from the one that was stored.
+
+    Args:
+        configuration: The component configuration.
+
+    Returns:
+        The compact JSON representation of the configuration.
+    """
+    return json.dumps(configuration, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_configuration(configuration: bytes) -> Dict[str, Any]:
+    """Deserialize a component configuration stored in the database.
+
+    Args:
+        configuration: The stored configuration.
+
+    Returns:
+        The component configuration.
+    """
+    if orjson is not None:
+        try:
+            return cast(Dict[str, Any], orjson.loads(configuration))
+        except orjson.JSONDecodeError:
+            # Fall back to the standard library for JSON extensions that
+            # `orjson` rejects, e.g. `NaN` values.
+            pass
+    return cast(Dict[str, Any], json.loads(configuration))
+
 
 class StackComponentSchema(SQLModel, table=True):
     """SQL Model for stack components."""
 
-    __tablename__ = "stack_component"
+    __tablename__ = STACK_COMPONENT_TABLE
+    __table_args__ = (
+        Index(
+            "ix_stack_component_project_id_is_shared_type",
+            "project_id",
+            "is_shared",
+            "type",
+        ),
+    )
 
     id: UUID = Field(primary_key=True)
 
@@ -43,7 +98,7 @@ class StackComponentSchema(SQLModel, table=True):
     is_shared: bool
 
     type: StackComponentType
-    flavor: str
+    flavor: str = Field(sa_column=Column(InternedString, nullable=False))
 
     project_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -68,7 +123,10 @@ class StackComponentSchema(SQLModel, table=True):
     configuration: bytes
 
     created: datetime = Field(default_factory=datetime.now)
-    updated: datetime = Field(default_factory=datetime.now)
+    updated: datetime = Field(
+        default_factory=datetime.now,
+        sa_column_kwargs={"onupdate": datetime.now},
+    )
 
     stacks: List["StackSchema"] = Relationship(
         back_populates="components", link_model=StackCompositionSchema
@@ -94,13 +152,72 @@ class StackComponentSchema(SQLModel, table=True):
             is_shared=component.is_shared,
             type=component.type,
             flavor=component.flavor,
-            configuration=base64.b64encode(
-                json.dumps(component.configuration).encode("utf-8")
-            ),
+            configuration=_encode_configuration(component.configuration),
             created=component.created,
             updated=component.updated,
         )
 
+    @classmethod
+    def with_related(cls) -> "SelectOfScalar[StackComponentSchema]":
+        """Build a query for components that eagerly loads their relationships.
+
+        The user and project of all returned components are loaded with one
+        additional `SELECT ... IN` query each, instead of one lazy query per
+        component and relationship when converting them to hydrated models.
+
+        Returns:
+            The query.
+        """
+        return select(cls).options(
+            selectinload(cls.user), selectinload(cls.project)
+        )
+
+    @classmethod
+    def bulk_from_create_models(
+        cls, components: Sequence[ComponentModel]
+    ) -> List[Dict[str, Any]]:
+        """Create the rows to bulk insert for a list of component models.
+
+        Args:
+            components: The component models from which to create the rows.
+
+        Returns:
+            A list of column name to value mappings, one for each component.
+        """
+        return [
+            {
+                "id": component.id,
+                "name": component.name,
+                "project_id": component.project,
+                "user_id": component.user,
+                "is_shared": component.is_shared,
+                "type": component.type,
+                "flavor": component.flavor,
+                "configuration": _encode_configuration(component.configuration),
+                "created": component.created,
+                "updated": component.updated,
+            }
+            for component in components
+        ]
+
+    @classmethod
+    def bulk_insert(
+        cls, session: Session, components: Sequence[ComponentModel]
+    ) -> None:
+        """Insert multiple components with a single `executemany` statement.
+
+        This bypasses the ORM unit of work, so the caller is responsible for
+        committing the session. Very large batches are split into pages by the
+        database driver (see `insertmanyvalues_page_size` on SQLAlchemy 2.x).
+
+        Args:
+            session: The session in which to insert the components.
+            components: The component models to insert.
+        """
+        if not components:
+            return
+        session.execute(insert(cls), cls.bulk_from_create_models(components))
+
     def from_update_model(
         self,
         component: ComponentModel,
@@ -115,9 +232,11 @@ class StackComponentSchema(SQLModel, table=True):
         """
         self.name = component.name
         self.is_shared = component.is_shared
-        self.configuration = base64.b64encode(
-            json.dumps(component.configuration).encode("utf-8")
-        )
+        configuration = _encode_configuration(component.configuration)
+        # Only assign changed configurations so unchanged (and potentially
+        # large) blobs don't mark the row dirty or end up in the UPDATE.
+        if configuration != self.configuration:
+            self.configuration = configuration
         return self
 
     def to_model(self) -> "ComponentModel":
@@ -126,7 +245,9 @@ class StackComponentSchema(SQLModel, table=True):
         Returns:
             A `ComponentModel`
         """
-        return ComponentModel(
+        # The values were validated before they were stored, so skip the
+        # (comparatively expensive) validation when loading them.
+        return ComponentModel.construct(
             id=self.id,
             name=self.name,
             type=self.type,
@@ -134,9 +255,26 @@ class StackComponentSchema(SQLModel, table=True):
             user=self.user_id,
             project=self.project_id,
             is_shared=self.is_shared,
-            configuration=json.loads(
-                base64.b64decode(self.configuration).decode()
-            ),
+            configuration=_decode_configuration(self.configuration),
+            created=self.created,
+            updated=self.updated,
+        )
+
+    def to_hydrated_model(self) -> "HydratedComponentModel":
+        """Creates a `HydratedComponentModel` from a `StackComponentSchema`.
+
+        Returns:
+            A `HydratedComponentModel`
+        """
+        return HydratedComponentModel.construct(
+            id=self.id,
+            name=self.name,
+            type=self.type,
+            flavor=self.flavor,
+            user=self.user.to_model(),
+            project=self.project.to_model(),
+            is_shared=self.is_shared,
+            configuration=_decode_configuration(self.configuration),
             created=self.created,
             updated=self.updated,
         )
@@ -14,10 +14,11 @@
 """SQL Model Implementations for Projects."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence
 from uuid import UUID
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import insert
+from sqlmodel import Field, Relationship, Session, SQLModel
 
 from zenml.models import ProjectModel
 
@@ -42,7 +43,10 @@ class ProjectSchema(SQLModel, table=True):
     name: str
     description: str
     created: datetime = Field(default_factory=datetime.now)
-    updated: datetime = Field(default_factory=datetime.now)
+    updated: datetime = Field(
+        default_factory=datetime.now,
+        sa_column_kwargs={"onupdate": datetime.now},
+    )
 
     user_role_assignments: List["UserRoleAssignmentSchema"] = Relationship(
         back_populates="project", sa_relationship_kwargs={"cascade": "delete"}
@@ -81,6 +85,49 @@ class ProjectSchema(SQLModel, table=True):
             id=project.id, name=project.name, description=project.description
         )
 
+    @classmethod
+    def bulk_from_create_models(
+        cls, projects: Sequence[ProjectModel]
+    ) -> List[Dict[str, Any]]:
+        """Create the rows to bulk insert for a list of project models.
+
+        Args:
+            projects: The project models from which to create the rows.
+
+        Returns:
+            A list of column name to value mappings, one for each project.
+        """
+        # Like the schema defaults used when creating a single project, the rows
+        # are timestamped at creation. All rows of a batch share a timestamp.
+        now = datetime.now()
+        return [
+            {
+                "id": project.id,
+                "name": project.name,
+                "description": project.description,
+                "created": now,
+                "updated": now,
+            }
+            for project in projects
+        ]
+
+    @classmethod
+    def bulk_insert(
+        cls, session: Session, projects: Sequence[ProjectModel]
+    ) -> None:
+        """Insert multiple projects with a single `executemany` statement.
+
+        This bypasses the ORM unit of work, so the caller is responsible for
+        committing the session.
+
+        Args:
+            session: The session in which to insert the projects.
+            projects: The project models to insert.
+        """
+        if not projects:
+            return
+        session.execute(insert(cls), cls.bulk_from_create_models(projects))
+
     def from_update_model(self, model: ProjectModel) -> "ProjectSchema":
         """Update a `ProjectSchema` from a `ProjectModel`.
 
@@ -92,7 +139,6 @@ class ProjectSchema(SQLModel, table=True):
         """
         self.name = model.name
         self.description = model.description
-        self.updated = datetime.now()
         return self
 
     def to_model(self) -> ProjectModel:
@@ -101,4 +147,12 @@ class ProjectSchema(SQLModel, table=True):
         Returns:
             The converted `ProjectModel`.
         """
-        return ProjectModel.parse_obj(self)
+        # The values were validated before they were stored, so skip the
+        # (comparatively expensive) validation when loading them.
+        return ProjectModel.construct(
+            id=self.id,
+            name=self.name,
+            description=self.description,
+            created=self.created,
+            updated=self.updated,
+        )
@@ -13,10 +13,40 @@
 #  permissions and limitations under the License.
 """Utility functions for SQLModel schemas."""
 
-from typing import Any
+import sys
+from typing import Any, Optional
 
 from sqlalchemy import Column, ForeignKey
+from sqlalchemy.engine import Dialect
 from sqlmodel import Field
+from sqlmodel.sql.sqltypes import AutoString
+
+
+class InternedString(AutoString):
+    """String column type that interns the values loaded from the database.
+
+    Meant for low cardinality columns (e.g. flavor names) that are repeated
+    across many rows: all loaded rows share a single string object per
+    distinct value instead of allocating a new one for each row.
+    """
+
+    cache_ok = True
+
+    def process_result_value(
+        self, value: Optional[str], dialect: Dialect
+    ) -> Optional[str]:
+        """Interns a string value loaded from the database.
+
+        Args:
+            value: The loaded value.
+            dialect: The database dialect.
+
+        Returns:
+            The interned value.
+        """
+        if value is None:
+            return None
+        return sys.intern(value)
 
 
 def foreign_key_constraint_name(
@@ -14,14 +14,22 @@
 """SQL Model Implementations for Stacks."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import Index, insert
+from sqlalchemy.orm import selectinload
+from sqlmodel import Field, Relationship, Session, SQLModel, select
+from sqlmodel.sql.expression import SelectOfScalar
 
-from zenml.models import HydratedStackModel, StackModel
+from zenml.enums import StackComponentType
+from zenml.models import ComponentModel, HydratedStackModel, StackModel
 from zenml.zen_stores.schemas.project_schemas import ProjectSchema
 from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.table_names import (
+    STACK_COMPONENT_TABLE,
+    STACK_TABLE,
+)
 from zenml.zen_stores.schemas.user_management_schemas import UserSchema
 
 if TYPE_CHECKING:
@@ -39,7 +47,7 @@ class StackCompositionSchema(SQLModel, table=True):
 
     stack_id: UUID = build_foreign_key_field(
         source=__tablename__,
-        target="stack",  # TODO: how to reference `StackSchema.__tablename__`?
+        target=STACK_TABLE,
         source_column="stack_id",
         target_column="id",
         ondelete="CASCADE",
@@ -48,7 +56,7 @@ class StackCompositionSchema(SQLModel, table=True):
     )
     component_id: UUID = build_foreign_key_field(
         source=__tablename__,
-        target="stack_component",  # TODO: how to reference `StackComponentSchema.__tablename__`?
+        target=STACK_COMPONENT_TABLE,
         source_column="component_id",
         target_column="id",
         ondelete="CASCADE",
@@ -60,11 +68,17 @@ class StackCompositionSchema(SQLModel, table=True):
 class StackSchema(SQLModel, table=True):
     """SQL Model for stacks."""
 
-    __tablename__ = "stack"
+    __tablename__ = STACK_TABLE
+    __table_args__ = (
+        Index("ix_stack_project_id_is_shared", "project_id", "is_shared"),
+    )
 
     id: UUID = Field(primary_key=True)
     created: datetime = Field(default_factory=datetime.now)
-    updated: datetime = Field(default_factory=datetime.now)
+    updated: datetime = Field(
+        default_factory=datetime.now,
+        sa_column_kwargs={"onupdate": datetime.now},
+    )
 
     name: str
     is_shared: bool
@@ -120,6 +134,82 @@ class StackSchema(SQLModel, table=True):
             components=defined_components,
         )
 
+    @classmethod
+    def with_related(
+        cls, hydrated: bool = True
+    ) -> "SelectOfScalar[StackSchema]":
+        """Build a query for stacks that eagerly loads their relationships.
+
+        The relationships are loaded with one additional `SELECT ... IN`
+        query each for all returned stacks, instead of one lazy query per
+        stack and relationship when converting the stacks to models.
+
+        Args:
+            hydrated: Whether to also load the user and project of the stacks,
+                which are only needed to create hydrated models.
+
+        Returns:
+            The query.
+        """
+        options = [selectinload(cls.components)]
+        if hydrated:
+            options += [selectinload(cls.user), selectinload(cls.project)]
+        return select(cls).options(*options)
+
+    @classmethod
+    def bulk_from_create_models(
+        cls, stacks: Sequence[StackModel]
+    ) -> List[Dict[str, Any]]:
+        """Create the rows to bulk insert for a list of stack models.
+
+        Args:
+            stacks: The stack models from which to create the rows.
+
+        Returns:
+            A list of column name to value mappings, one for each stack.
+        """
+        # Like the schema defaults used when creating a single stack, the rows
+        # are timestamped at creation. All rows of a batch share a timestamp.
+        now = datetime.now()
+        return [
+            {
+                "id": stack.id,
+                "name": stack.name,
+                "project_id": stack.project,
+                "user_id": stack.user,
+                "is_shared": stack.is_shared,
+                "created": now,
+                "updated": now,
+            }
+            for stack in stacks
+        ]
+
+    @classmethod
+    def bulk_insert(
+        cls, session: Session, stacks: Sequence[StackModel]
+    ) -> None:
+        """Insert multiple stacks with one `executemany` statement per table.
+
+        The components referenced by the stacks must already exist in the
+        database. This bypasses the ORM unit of work, so the caller is
+        responsible for committing the session.
+
+        Args:
+            session: The session in which to insert the stacks.
+            stacks: The stack models to insert.
+        """
+        if not stacks:
+            return
+        session.execute(insert(cls), cls.bulk_from_create_models(stacks))
+        composition_rows = [
+            {"stack_id": stack.id, "component_id": component_id}
+            for stack in stacks
+            for component_ids in stack.components.values()
+            for component_id in component_ids
+        ]
+        if composition_rows:
+            session.execute(insert(StackCompositionSchema), composition_rows)
+
     def from_update_model(
         self,
         defined_components: List["StackComponentSchema"],
@@ -137,6 +227,8 @@ class StackSchema(SQLModel, table=True):
         self.name = stack.name
         self.is_shared = stack.is_shared
         self.components = defined_components
+        # Changes to the components only touch the composition table, so the
+        # `onupdate` of the stack row wouldn't fire for them.
         self.updated = datetime.now()
         return self
 
@@ -146,15 +238,17 @@ class StackSchema(SQLModel, table=True):
         Returns:
             a `StackModel`.
         """
-        # This needs to be updated once multiple stack components per type are
-        #  supported
+        components: Dict[StackComponentType, List[UUID]] = {}
+        for c in self.components:
+            components.setdefault(c.type, []).append(c.id)
+
         return StackModel(
             id=self.id,
             name=self.name,
             user=self.user_id,
             project=self.project_id,
             is_shared=self.is_shared,
-            components={c.type: [c.id] for c in self.components},
+            components=components,
             created=self.created,
             updated=self.updated,
         )
@@ -165,13 +259,17 @@ class StackSchema(SQLModel, table=True):
         Returns:
             a 'HydratedStackModel'.
         """
+        components: Dict[StackComponentType, List[ComponentModel]] = {}
+        for c in self.components:
+            components.setdefault(c.type, []).append(c.to_model())
+
         return HydratedStackModel(
             id=self.id,
             name=self.name,
             user=self.user.to_model(),
             project=self.project.to_model(),
             is_shared=self.is_shared,
-            components={c.type: [c.to_model()] for c in self.components},
+            components=components,
             created=self.created,
             updated=self.updated,
         )
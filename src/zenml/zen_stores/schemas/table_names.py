@@ -0,0 +1,24 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Names of SQL tables that are referenced before their schema is defined.
+
+Join tables need to reference the tables they link in their foreign keys,
+but are defined before the schemas of those tables. Sharing the names as
+constants avoids hardcoding them in multiple places.
+"""
+
+STACK_TABLE = "stack"
+STACK_COMPONENT_TABLE = "stack_component"
+USER_TABLE = "user"
+TEAM_TABLE = "team"
@@ -13,15 +13,20 @@
 #  permissions and limitations under the License.
 """SQL Model Implementations for Users, Teams, Roles."""
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 from uuid import UUID, uuid4
 
-from sqlmodel import Field, Relationship, SQLModel
+from pydantic import SecretStr
+from sqlalchemy import Index, insert, select
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
+from sqlmodel import Field, Relationship, Session, SQLModel
 
 from zenml.enums import PermissionType
 from zenml.models import RoleAssignmentModel, RoleModel, TeamModel, UserModel
 from zenml.zen_stores.schemas.project_schemas import ProjectSchema
 from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.table_names import TEAM_TABLE, USER_TABLE
 
 if TYPE_CHECKING:
     from zenml.zen_stores.schemas import (
@@ -32,6 +37,20 @@ if TYPE_CHECKING:
         StackSchema,
     )
 
+_PERMISSION_BY_NAME = {p.value: p for p in PermissionType}
+
+
+def _to_secret(value: Optional[str]) -> Optional[SecretStr]:
+    """Wraps a stored secret value.
+
+    Args:
+        value: The stored value.
+
+    Returns:
+        The wrapped value or `None` if no value is stored.
+    """
+    return SecretStr(value) if value is not None else None
+
 
 class TeamAssignmentSchema(SQLModel, table=True):
     """SQL Model for team assignments."""
@@ -40,7 +59,7 @@ class TeamAssignmentSchema(SQLModel, table=True):
 
     user_id: UUID = build_foreign_key_field(
         source=__tablename__,
-        target="user",  # TODO: how to reference `UserSchema.__tablename__`?
+        target=USER_TABLE,
         source_column="user_id",
         target_column="id",
         ondelete="CASCADE",
@@ -49,7 +68,7 @@ class TeamAssignmentSchema(SQLModel, table=True):
     )
     team_id: UUID = build_foreign_key_field(
         source=__tablename__,
-        target="team",  # TODO: how to reference `TeamSchema.__tablename__`?
+        target=TEAM_TABLE,
         source_column="team_id",
         target_column="id",
         ondelete="CASCADE",
@@ -61,7 +80,7 @@ class TeamAssignmentSchema(SQLModel, table=True):
 class UserSchema(SQLModel, table=True):
     """SQL Model for users."""
 
-    __tablename__ = "user"
+    __tablename__ = USER_TABLE
 
     id: UUID = Field(primary_key=True)
     name: str
@@ -71,7 +90,10 @@ class UserSchema(SQLModel, table=True):
     password: Optional[str] = Field(nullable=True)
     activation_token: Optional[str] = Field(nullable=True)
     created: datetime = Field(default_factory=datetime.now)
-    updated: datetime = Field(default_factory=datetime.now)
+    updated: datetime = Field(
+        default_factory=datetime.now,
+        sa_column_kwargs={"onupdate": datetime.now},
+    )
 
     email_opted_in: Optional[bool] = Field(nullable=True)
 
@@ -130,7 +152,6 @@ class UserSchema(SQLModel, table=True):
         self.active = model.active
         self.password = model.get_hashed_password()
         self.activation_token = model.get_hashed_activation_token()
-        self.updated = datetime.now()
         return self
 
     def to_model(self) -> UserModel:
@@ -139,15 +160,18 @@ class UserSchema(SQLModel, table=True):
         Returns:
             The converted `UserModel`.
         """
-        return UserModel(
+        # Users are loaded for most hydrated models, so skip validating the
+        # stored values. The secrets need to be wrapped manually as that
+        # usually happens during validation.
+        return UserModel.construct(
             id=self.id,
             name=self.name,
             full_name=self.full_name,
             email=self.email,
             email_opted_in=self.email_opted_in,
             active=self.active,
-            password=self.password,
-            activation_token=self.activation_token,
+            password=_to_secret(self.password),
+            activation_token=_to_secret(self.activation_token),
             created=self.created,
             updated=self.updated,
         )
@@ -156,12 +180,15 @@ class UserSchema(SQLModel, table=True):
 class TeamSchema(SQLModel, table=True):
     """SQL Model for teams."""
 
-    __tablename__ = "team"
+    __tablename__ = TEAM_TABLE
 
     id: UUID = Field(primary_key=True)
     name: str
     created: datetime = Field(default_factory=datetime.now)
-    updated: datetime = Field(default_factory=datetime.now)
+    updated: datetime = Field(
+        default_factory=datetime.now,
+        sa_column_kwargs={"onupdate": datetime.now},
+    )
 
     users: List["UserSchema"] = Relationship(
         back_populates="teams", link_model=TeamAssignmentSchema
@@ -192,7 +219,6 @@ class TeamSchema(SQLModel, table=True):
             The updated `TeamSchema`.
         """
         self.name = model.name
-        self.updated = datetime.now()
         return self
 
     def to_model(self) -> TeamModel:
@@ -201,7 +227,7 @@ class TeamSchema(SQLModel, table=True):
         Returns:
             The converted `TeamModel`.
         """
-        return TeamModel(
+        return TeamModel.construct(
             id=self.id,
             name=self.name,
             created=self.created,
@@ -218,8 +244,11 @@ class RoleSchema(SQLModel, table=True):
     name: str
     created: datetime = Field(default_factory=datetime.now)
     updated: datetime = Field(default_factory=datetime.now)
+    # The permissions are read whenever a role is converted to a model, so
+    # load them for all roles of a query at once.
     permissions: List["RolePermissionSchema"] = Relationship(
-        back_populates="roles", sa_relationship_kwargs={"cascade": "delete"}
+        back_populates="roles",
+        sa_relationship_kwargs={"cascade": "delete", "lazy": "selectin"},
     )
     user_role_assignments: List["UserRoleAssignmentSchema"] = Relationship(
         back_populates="role", sa_relationship_kwargs={"cascade": "delete"}
@@ -250,6 +279,8 @@ class RoleSchema(SQLModel, table=True):
             The updated `RoleSchema`.
         """
         self.name = model.name
+        # Changes to the permissions only touch the permission table, so an
+        # `onupdate` of the role row wouldn't fire for them.
         self.updated = datetime.now()
         return self
 
@@ -259,12 +290,12 @@ class RoleSchema(SQLModel, table=True):
         Returns:
             The converted `RoleModel`.
         """
-        return RoleModel(
+        return RoleModel.construct(
             id=self.id,
             name=self.name,
             created=self.created,
             updated=self.updated,
-            permissions=[PermissionType(p.name) for p in self.permissions],
+            permissions={_PERMISSION_BY_NAME[p.name] for p in self.permissions},
         )
 
 
@@ -272,6 +303,14 @@ class UserRoleAssignmentSchema(SQLModel, table=True):
     """SQL Model for assigning roles to users for a given project."""
 
     __tablename__ = "user_role_assignment"
+    __table_args__ = (
+        Index(
+            "ix_user_role_assignment_user_id_role_id_project_id",
+            "user_id",
+            "role_id",
+            "project_id",
+        ),
+    )
 
     id: UUID = Field(primary_key=True, default_factory=uuid4)
     role_id: UUID = build_foreign_key_field(
@@ -307,13 +346,51 @@ class UserRoleAssignmentSchema(SQLModel, table=True):
         back_populates="user_role_assignments"
     )
 
+    @classmethod
+    def select_model_columns(cls) -> "Select":
+        """Build a query for the columns needed to create assignment models.
+
+        Selecting only the columns skips creating schema instances and adding
+        them to the identity map of the session when listing assignments.
+
+        Returns:
+            The query.
+        """
+        return select(
+            cls.id,
+            cls.role_id,
+            cls.user_id,
+            cls.project_id,
+            cls.created,
+            cls.updated,
+        )
+
+    @staticmethod
+    def model_from_row(row: "Row") -> RoleAssignmentModel:
+        """Create a `RoleAssignmentModel` from a row of `select_model_columns`.
+
+        Args:
+            row: The row.
+
+        Returns:
+            The created `RoleAssignmentModel`.
+        """
+        return RoleAssignmentModel.construct(
+            id=row.id,
+            role=row.role_id,
+            user=row.user_id,
+            project=row.project_id,
+            created=row.created,
+            updated=row.updated,
+        )
+
     def to_model(self) -> RoleAssignmentModel:
         """Convert a `UserRoleAssignmentSchema` to a `RoleAssignmentModel`.
 
         Returns:
             The converted `RoleAssignmentModel`.
         """
-        return RoleAssignmentModel(
+        return RoleAssignmentModel.construct(
             id=self.id,
             role=self.role_id,
             user=self.user_id,
@@ -327,6 +404,14 @@ class TeamRoleAssignmentSchema(SQLModel, table=True):
     """SQL Model for assigning roles to teams for a given project."""
 
     __tablename__ = "team_role_assignment"
+    __table_args__ = (
+        Index(
+            "ix_team_role_assignment_team_id_role_id_project_id",
+            "team_id",
+            "role_id",
+            "project_id",
+        ),
+    )
 
     id: UUID = Field(primary_key=True, default_factory=uuid4)
     role_id: UUID = build_foreign_key_field(
@@ -362,13 +447,51 @@ class TeamRoleAssignmentSchema(SQLModel, table=True):
         back_populates="team_role_assignments"
     )
 
+    @classmethod
+    def select_model_columns(cls) -> "Select":
+        """Build a query for the columns needed to create assignment models.
+
+        Selecting only the columns skips creating schema instances and adding
+        them to the identity map of the session when listing assignments.
+
+        Returns:
+            The query.
+        """
+        return select(
+            cls.id,
+            cls.role_id,
+            cls.team_id,
+            cls.project_id,
+            cls.created,
+            cls.updated,
+        )
+
+    @staticmethod
+    def model_from_row(row: "Row") -> RoleAssignmentModel:
+        """Create a `RoleAssignmentModel` from a row of `select_model_columns`.
+
+        Args:
+            row: The row.
+
+        Returns:
+            The created `RoleAssignmentModel`.
+        """
+        return RoleAssignmentModel.construct(
+            id=row.id,
+            role=row.role_id,
+            team=row.team_id,
+            project=row.project_id,
+            created=row.created,
+            updated=row.updated,
+        )
+
     def to_model(self) -> RoleAssignmentModel:
         """Convert a `TeamRoleAssignmentSchema` to a `RoleAssignmentModel`.
 
         Returns:
             The converted `RoleAssignmentModel`.
         """
-        return RoleAssignmentModel(
+        return RoleAssignmentModel.construct(
             id=self.id,
             role=self.role_id,
             team=self.team_id,
@@ -382,6 +505,9 @@ class RolePermissionSchema(SQLModel, table=True):
     """SQL Model for team assignments."""
 
     __tablename__ = "role_permission"
+    # The primary key starts with the name, so it can't be used to look up the
+    # permissions of a role.
+    __table_args__ = (Index("ix_role_permission_role_id", "role_id"),)
 
     name: PermissionType = Field(primary_key=True)
     role_id: UUID = build_foreign_key_field(
@@ -394,3 +520,24 @@ class RolePermissionSchema(SQLModel, table=True):
         primary_key=True,
     )
     roles: List["RoleSchema"] = Relationship(back_populates="permissions")
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        session: Session,
+        role_id: UUID,
+        permissions: Iterable[PermissionType],
+    ) -> None:
+        """Insert multiple permissions of a role with one `executemany`.
+
+        This bypasses the ORM unit of work, so the caller is responsible for
+        committing the session.
+
+        Args:
+            session: The session in which to insert the permissions.
+            role_id: The ID of the role to which the permissions belong.
+            permissions: The permissions to insert.
+        """
+        rows = [{"name": p, "role_id": role_id} for p in permissions]
+        if rows:
+            session.execute(insert(cls), rows)
@@ -65,6 +65,7 @@ from zenml.models import (
     ArtifactModel,
     ComponentModel,
     FlavorModel,
+    HydratedComponentModel,
     HydratedStackModel,
     PipelineModel,
     PipelineRunModel,
@@ -170,6 +171,12 @@ class SqlZenStoreConfiguration(StoreConfiguration):
             pool.
         max_overflow: The maximum number of connections to allow in the
             SQLAlchemy pool in addition to the pool_size.
+        pool_pre_ping: set to test pooled connections for liveness on every
+            checkout and replace the ones that the server closed, e.g. after
+            its `wait_timeout` or a restart. This costs one additional round
+            trip per checkout.
+        pool_recycle: The number of seconds after which pooled connections
+            are replaced. The default of -1 never replaces connections.
         grpc_metadata_host: The host to use for the gRPC metadata server.
         grpc_metadata_port: The port to use for the gRPC metadata server.
         grpc_metadata_ssl_ca: The certificate authority certificate to use for
@@ -192,6 +199,8 @@ class SqlZenStoreConfiguration(StoreConfiguration):
     ssl_verify_server_cert: bool = False
     pool_size: int = 20
     max_overflow: int = 20
+    pool_pre_ping: bool = False
+    pool_recycle: int = -1
 
     grpc_metadata_host: Optional[str] = None
     grpc_metadata_port: Optional[int] = None
@@ -505,6 +514,8 @@ class SqlZenStoreConfiguration(StoreConfiguration):
             engine_args = {
                 "pool_size": self.pool_size,
                 "max_overflow": self.max_overflow,
+                "pool_pre_ping": self.pool_pre_ping,
+                "pool_recycle": self.pool_recycle,
             }
 
             sql_url = sql_url._replace(
@@ -898,7 +909,7 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             # Get a list of all stacks
-            query = select(StackSchema)
+            query = StackSchema.with_related(hydrated=hydrated)
             # TODO: prettify
             if project_name_or_id:
                 project = self._get_project_schema(
@@ -1197,7 +1208,8 @@ class SqlZenStore(BaseZenStore):
         flavor_name: Optional[str] = None,
         name: Optional[str] = None,
         is_shared: Optional[bool] = None,
-    ) -> List[ComponentModel]:
+        hydrated: bool = False,
+    ) -> Union[List[ComponentModel], List[HydratedComponentModel]]:
         """List all stack components matching the given filter criteria.
 
         Args:
@@ -1209,13 +1221,17 @@ class SqlZenStore(BaseZenStore):
             name: Optionally filter stack component by name
             is_shared: Optionally filter out stack component by whether they are
                 shared or not
+            hydrated: Flag to decide whether to return hydrated models.
 
         Returns:
             A list of all stack components matching the filter criteria.
         """
         with Session(self.engine) as session:
             # Get a list of all stacks
-            query = select(StackComponentSchema)
+            if hydrated:
+                query = StackComponentSchema.with_related()
+            else:
+                query = select(StackComponentSchema)
             if project_name_or_id:
                 project = self._get_project_schema(
                     project_name_or_id, session=session
@@ -1237,7 +1253,15 @@ class SqlZenStore(BaseZenStore):
 
             list_of_stack_components_in_db = session.exec(query).all()
 
-        return [comp.to_model() for comp in list_of_stack_components_in_db]
+            if hydrated:
+                return [
+                    comp.to_hydrated_model()
+                    for comp in list_of_stack_components_in_db
+                ]
+            else:
+                return [
+                    comp.to_model() for comp in list_of_stack_components_in_db
+                ]
 
     @track(AnalyticsEvent.UPDATED_STACK_COMPONENT)
     def update_stack_component(
@@ -2032,12 +2056,12 @@ class SqlZenStore(BaseZenStore):
             # Create role
             role_schema = RoleSchema.from_create_model(role)
             session.add(role_schema)
-            session.commit()
+            # The role needs to exist before its permissions reference it
+            session.flush()
             # Add all permissions
-            for p in role.permissions:
-                session.add(
-                    RolePermissionSchema(name=p, role_id=role_schema.id)
-                )
+            RolePermissionSchema.bulk_insert(
+                session, role_id=role_schema.id, permissions=role.permissions
+            )
 
             session.commit()
             return role_schema.to_model()
@@ -2116,12 +2140,11 @@ class SqlZenStore(BaseZenStore):
                     ).one_or_none()
                     session.delete(permission_to_delete)
 
-                elif permission not in existing_permissions:
-                    session.add(
-                        RolePermissionSchema(
-                            name=permission, role_id=existing_role.id
-                        )
-                    )
+            RolePermissionSchema.bulk_insert(
+                session,
+                role_id=existing_role.id,
+                permissions=diff - existing_permissions,
+            )
 
             session.commit()
 
@@ -2194,7 +2217,7 @@ class SqlZenStore(BaseZenStore):
             A list of user role assignments.
         """
         with Session(self.engine) as session:
-            query = select(UserRoleAssignmentSchema)
+            query = UserRoleAssignmentSchema.select_model_columns()
             if project_name_or_id is not None:
                 project = self._get_project_schema(
                     project_name_or_id, session=session
@@ -2208,8 +2231,10 @@ class SqlZenStore(BaseZenStore):
             if user_name_or_id is not None:
                 user = self._get_user_schema(user_name_or_id, session=session)
                 query = query.where(UserRoleAssignmentSchema.user_id == user.id)
-            assignments = session.exec(query).all()
-            return [assignment.to_model() for assignment in assignments]
+            rows = session.execute(query).all()
+            return [
+                UserRoleAssignmentSchema.model_from_row(row) for row in rows
+            ]
 
     def _list_team_role_assignments(
         self,
@@ -2230,7 +2255,7 @@ class SqlZenStore(BaseZenStore):
             A list of team role assignments.
         """
         with Session(self.engine) as session:
-            query = select(TeamRoleAssignmentSchema)
+            query = TeamRoleAssignmentSchema.select_model_columns()
             if project_name_or_id is not None:
                 project = self._get_project_schema(
                     project_name_or_id, session=session
@@ -2244,8 +2269,10 @@ class SqlZenStore(BaseZenStore):
             if team_name_or_id is not None:
                 team = self._get_team_schema(team_name_or_id, session=session)
                 query = query.where(TeamRoleAssignmentSchema.team_id == team.id)
-            assignments = session.exec(query).all()
-            return [assignment.to_model() for assignment in assignments]
+            rows = session.execute(query).all()
+            return [
+                TeamRoleAssignmentSchema.model_from_row(row) for row in rows
+            ]
 
     def list_role_assignments(
         self,
@@ -21,6 +21,7 @@ from zenml.models import (
     ArtifactModel,
     ComponentModel,
     FlavorModel,
+    HydratedComponentModel,
     HydratedStackModel,
     PipelineModel,
     PipelineRunModel,
@@ -268,7 +269,8 @@ class ZenStoreInterface(ABC):
         flavor_name: Optional[str] = None,
         name: Optional[str] = None,
         is_shared: Optional[bool] = None,
-    ) -> List[ComponentModel]:
+        hydrated: bool = False,
+    ) -> Union[List[ComponentModel], List[HydratedComponentModel]]:
         """List all stack components matching the given filter criteria.
 
         Args:
@@ -280,6 +282,7 @@ class ZenStoreInterface(ABC):
             name: Optionally filter stack component by name
             is_shared: Optionally filter out stack component by whether they are
                 shared or not
+            hydrated: Flag to decide whether to return hydrated models.
 
         Returns:
             A list of all stack components matching the filter criteria.
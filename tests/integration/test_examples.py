@@ -27,19 +27,37 @@ from .example_validations import (
     mlflow_tracking_example_validation,
 )
 
+# Files and directories that are not needed to run an example: any existing
+# ZenML repository as well as caches of Python, Jupyter and other tools
+_SKIPPED_NAMES = {
+    ".zen",
+    ".git",
+    "__pycache__",
+    ".ipynb_checkpoints",
+    ".pytest_cache",
+    ".mypy_cache",
+}
+_SKIPPED_SUFFIXES = (".pyc", ".pyo")
+
 
 def copy_example_files(example_dir: str, dst_dir: str) -> None:
-    for item in os.listdir(example_dir):
-        if item == ".zen":
-            # don't copy any existing ZenML repository
-            continue
-
-        s = os.path.join(example_dir, item)
-        d = os.path.join(dst_dir, item)
-        if os.path.isdir(s):
-            shutil.copytree(s, d)
-        else:
-            shutil.copy2(s, d)
+    # `os.scandir` reuses the file type information returned when listing the
+    # directory, so entries don't need to be stat'ed again to dispatch them.
+    with os.scandir(example_dir) as entries:
+        for entry in entries:
+            if entry.name in _SKIPPED_NAMES or entry.name.endswith(
+                _SKIPPED_SUFFIXES
+            ):
+                continue
+
+            d = os.path.join(dst_dir, entry.name)
+            if entry.is_dir():
+                os.mkdir(d)
+                copy_example_files(entry.path, d)
+            else:
+                # The copies are thrown away after the test, so only the
+                # permission bits (e.g. of executable scripts) are preserved
+                shutil.copy(entry.path, d)
 
 
 def example_runner(examples_dir):
@@ -0,0 +1,38 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import pytest
+
+from zenml.utils import networking_utils
+
+
+@pytest.mark.parametrize("address", ["127.0.0.1", "0.0.0.0"])
+def test_find_available_port_returns_port_available_on_address(
+    address: str,
+) -> None:
+    """Check that the found port can be bound on the requested address."""
+    port = networking_utils.find_available_port(address)
+
+    assert 0 < port <= 65535
+    assert networking_utils.port_available(port, address)
+
+
+def test_find_available_port_looks_up_port_on_given_address() -> None:
+    """Check that the port is looked up on the given address.
+
+    192.0.2.1 is reserved for documentation and not assigned to any local
+    interface, so binding a port on it fails.
+    """
+    with pytest.raises(OSError):
+        networking_utils.find_available_port("192.0.2.1")
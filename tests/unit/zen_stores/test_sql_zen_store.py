@@ -12,11 +12,14 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import math
 import uuid
 from contextlib import ExitStack as does_not_raise
+from datetime import datetime
 
 import pytest
 from ml_metadata.proto.metadata_store_pb2 import ConnectionConfig
+from sqlmodel import Session
 
 from zenml.config.pipeline_configurations import PipelineSpec
 from zenml.enums import ExecutionStatus, PermissionType, StackComponentType
@@ -37,6 +40,7 @@ from zenml.models import (
 from zenml.models.pipeline_models import PipelineModel
 from zenml.models.stack_models import StackModel
 from zenml.zen_stores.base_zen_store import BaseZenStore
+from zenml.zen_stores.schemas import StackComponentSchema
 
 DEFAULT_NAME = "default"
 
@@ -1286,6 +1290,79 @@ def test_create_component_fails_when_same_name(
         sql_store["store"].create_stack_component(component=stack_component)
 
 
+def test_stack_component_configuration_round_trips_non_finite_floats(
+    sql_store: BaseZenStore,
+):
+    """Tests that NaN and infinite configuration values are stored as is."""
+    stack_component = ComponentModel(
+        name="arias_orchestrator",
+        type=StackComponentType.ORCHESTRATOR,
+        flavor="default",
+        configuration={
+            "nan": float("nan"),
+            "inf": float("inf"),
+            "-inf": float("-inf"),
+        },
+        project=sql_store["default_project"].id,
+        user=sql_store["active_user"].id,
+    )
+    sql_store["store"].create_stack_component(component=stack_component)
+    configuration = (
+        sql_store["store"]
+        .get_stack_component(component_id=stack_component.id)
+        .configuration
+    )
+    assert math.isnan(configuration["nan"])
+    assert configuration["inf"] == float("inf")
+    assert configuration["-inf"] == float("-inf")
+
+
+def test_stack_component_configuration_rejects_non_json_values(
+    sql_store: BaseZenStore,
+):
+    """Tests that values without a JSON representation are not stored."""
+    stack_component = ComponentModel(
+        name="arias_orchestrator",
+        type=StackComponentType.ORCHESTRATOR,
+        flavor="default",
+        configuration={"created": datetime.now()},
+        project=sql_store["default_project"].id,
+        user=sql_store["active_user"].id,
+    )
+    with pytest.raises(TypeError):
+        sql_store["store"].create_stack_component(component=stack_component)
+
+
+def test_bulk_inserting_stack_components_succeeds(
+    sql_store: BaseZenStore,
+):
+    """Tests bulk inserting stack components with a single statement."""
+    stack_components = [
+        ComponentModel(
+            name=f"arias_orchestrator_{i}",
+            type=StackComponentType.ORCHESTRATOR,
+            flavor="default",
+            configuration={"index": i},
+            project=sql_store["default_project"].id,
+            user=sql_store["active_user"].id,
+        )
+        for i in range(3)
+    ]
+    with Session(sql_store["store"].engine) as session:
+        StackComponentSchema.bulk_insert(session, stack_components)
+        session.commit()
+
+    for stack_component in stack_components:
+        created_stack_component = sql_store["store"].get_stack_component(
+            component_id=stack_component.id
+        )
+        assert created_stack_component.name == stack_component.name
+        assert (
+            created_stack_component.configuration
+            == stack_component.configuration
+        )
+
+
 def test_get_stack_component(
     sql_store: BaseZenStore,
 ):
@@ -1317,6 +1394,19 @@ def test_list_stack_components_succeeds(
     assert StackComponentType.ARTIFACT_STORE in component_types
 
 
+def test_list_hydrated_stack_components_succeeds(
+    sql_store: BaseZenStore,
+):
+    """Tests listing hydrated stack components."""
+    stack_components = sql_store["store"].list_stack_components(
+        project_name_or_id=sql_store["default_project"].name, hydrated=True
+    )
+    assert len(stack_components) == 2
+    for component in stack_components:
+        assert component.project.id == sql_store["default_project"].id
+        assert component.user.id == sql_store["active_user"].id
+
+
 def test_list_stack_components_fails_when_project_does_not_exist(
     sql_store: BaseZenStore,
 ):